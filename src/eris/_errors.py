@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
+import linecache
+from sys import _getframe
 import traceback
+from types import CodeType
 from typing import (
+    Any,
+    ClassVar,
+    Dict,
     Final,
     Iterator,
     List,
     Literal,
     Optional,
+    Tuple,
+    Type,
     TypedDict,
     TypeVar,
     Union,
 )
 
 from ion import efill
-from metaman import Inspector, cname
 
 
 Exc_T = TypeVar("Exc_T", bound=Exception)
@@ -32,6 +39,10 @@ FIRST_EXC_IS_WRONG_TYPE: Final = (
 )
 NULL: Final[Null] = "null"
 
+# Maps a code object to the (module_name, func_name, file_name) metadata that
+# we attach to any ErisError constructed by it.
+_FRAME_META_CACHE: Final[Dict[CodeType, Tuple[str, str, str]]] = {}
+
 
 class ExcInfo(TypedDict):
     """Represents a single exception."""
@@ -42,13 +53,17 @@ class ExcInfo(TypedDict):
 
 
 class ErisErrorDict(TypedDict):
-    """An Error type represented as a dictionary."""
+    """An Error type represented as a dictionary.
+
+    NOTE: Like any other TypedDict, this is just a plain dict at runtime, so
+    it can be passed directly to `json.dumps()`.
+    """
 
     # exception info
     exc_info: ExcInfo
 
     # metadata
-    lineno: int
+    lineno: Nullable[int]
     module_name: str
     func_name: str
     file_name: str
@@ -61,31 +76,108 @@ class ErisErrorDict(TypedDict):
 class ErisError(Exception):
     """Custom general-purpose exception."""
 
-    def __init__(self, emsg: str, up: int = 0) -> None:
-        self.inspector = Inspector(up=up + 1)
+    __slots__ = (
+        "_module_name",
+        "_func_name",
+        "_lineno",
+        "_file_name",
+        "_repr_cache",
+    )
+
+    # The name of this class, which is used by __repr__().
+    _CNAME: ClassVar[str] = "ErisError"
+
+    def __init__(self, emsg: str, up: Optional[int] = 0) -> None:
+        """Initializes an ErisError.
+
+        Args:
+            emsg: The error message.
+            up: How far up the stack should we look for this error's metadata
+              (e.g. the line number it was created on)? If None, the stack is
+              not inspected at all and this metadata will be set to "null".
+        """
+        # We snapshot the caller's metadata eagerly (instead of holding onto
+        # an Inspector object) since frame inspection is the most expensive
+        # part of constructing an error.
+        self._lineno: Nullable[int]
+        meta: Tuple[str, str, str]
+        if up is None:
+            meta = (NULL, NULL, NULL)
+            self._lineno = NULL
+        else:
+            frame = _getframe(up + 1)
+            code = frame.f_code
+            cached_meta = _FRAME_META_CACHE.get(code)
+            if cached_meta is None:
+                meta = _FRAME_META_CACHE[code] = (
+                    frame.f_globals.get("__name__", NULL),
+                    code.co_name,
+                    code.co_filename,
+                )
+            else:
+                meta = cached_meta
+            self._lineno = frame.f_lineno
+
+        self._module_name, self._func_name, self._file_name = meta
+
+        # Holds the (args, repr) pair from the last time __repr__() was
+        # called, so that errors that are never printed never pay for
+        # formatting and errors that are printed only pay once.
+        self._repr_cache: Optional[Tuple[Tuple[object, ...], str]] = None
+
         super().__init__(emsg)
 
-    def __str__(self) -> str:  # noqa: D105
-        return self.__repr__()
+    def __reduce__(self) -> Tuple[Any, ...]:  # noqa: D105
+        # BaseException.__reduce__() only preserves `args` and `__dict__`, so
+        # we need to save our metadata slots ourselves. Calling __init__()
+        # again would also re-inspect the (wrong) stack.
+        state: Dict[str, Any] = dict(self.__dict__)
+        state["_module_name"] = self._module_name
+        state["_func_name"] = self._func_name
+        state["_lineno"] = self._lineno
+        state["_file_name"] = self._file_name
+        return (_rebuild_eris_error, (type(self), self.args), state)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: D105
+        super().__init_subclass__(**kwargs)
+        cls._CNAME = cls.__name__
+
+    @property
+    def module_name(self) -> str:
+        """The name of the module this error was created in."""
+        return self._module_name
+
+    @property
+    def func_name(self) -> str:
+        """The name of the function this error was created in."""
+        return self._func_name
+
+    @property
+    def lineno(self) -> Nullable[int]:
+        """The line number this error was created on."""
+        return self._lineno
+
+    @property
+    def file_name(self) -> str:
+        """The name of the file this error was created in."""
+        return self._file_name
 
     def __repr__(self) -> str:  # noqa: D105
-        return self._repr()
-
-    def _repr(self, width: int = 80) -> str:
-        """
-        Format error to width.  If width is None, return string suitable for
-        traceback.
-        """
-        super_str = super().__str__()
-
-        emsg = efill(super_str, width, indent=2)
-        return "{}::{}::{}::{}{{\n{}\n}}".format(
-            cname(self),
-            self.inspector.module_name,
-            self.inspector.function_name,
-            self.inspector.line_number,
-            emsg,
+        args = self.args
+        repr_cache = self._repr_cache
+        if repr_cache is not None and repr_cache[0] is args:
+            return repr_cache[1]
+
+        emsg = efill(super().__str__(), 80, indent=2)
+        result = (
+            f"{type(self)._CNAME}::{self._module_name}::{self._func_name}"
+            f"::{self._lineno}{{\n{emsg}\n}}"
         )
+        self._repr_cache = (args, result)
+        return result
+
+    def __str__(self) -> str:  # noqa: D105
+        return self.__repr__()
 
     def __iter__(self) -> Iterator["BaseException"]:  # noqa: D105
         yield self
@@ -95,11 +187,20 @@ class ErisError(Exception):
             yield e
             e = e.__cause__
 
+    def _chain_list(self) -> List[BaseException]:
+        """Returns a list containing this exception and all of its causes."""
+        result: List[BaseException] = [self]
+        e = self.__cause__
+        while e:
+            result.append(e)
+            e = e.__cause__
+        return result
+
     def chain(self, other: Exception) -> "ErisError":
         """Chains this exception to another."""
         return _chain_errors(self, other)
 
-    def to_json(self) -> ErisErrorChain:
+    def to_json(self, include_source: bool = True) -> ErisErrorChain:
         """Converts this error into a list of dictionaries.
 
         This list is JSON serializable and is composed of data on this
@@ -108,30 +209,61 @@ class ErisError(Exception):
         NOTE: The list is sorted from last-to-first exception to be raised
         (i.e. this exception, the exception that caused this exception,
         etc...).
+
+        Args:
+            include_source: If False, source code lines (which have to be read
+              from disk) will NOT be included in any 'stack' list. Each stack
+              will then only contain the file name, line number, and function
+              name of any traceback entries.
         """
-        result = []
+        eris_error_type = ErisError
+
+        # Count the ErisError objects in this chain up front (every other
+        # exception gets merged into the ErisError before it) so we can
+        # allocate the result list once instead of growing it.
+        chain = self._chain_list()
+        n = 0
+        for e in chain:
+            if isinstance(e, eris_error_type):
+                n += 1
+
+        result: ErisErrorChain = [None] * n  # type: ignore[list-item]
+        result_idx = 0
         last_stack: Optional[List[str]] = None
         last_caused_by: Optional[List[ExcInfo]] = None
-        for error in self:
-            if isinstance(error, ErisError):
+        for error in chain:
+            error_type = type(error)
+            # Most chains only contain ErisError objects and builtin
+            # exceptions, so we check for an exact type match before falling
+            # back to the (slower) subclass check.
+            if error_type is eris_error_type or issubclass(
+                error_type, eris_error_type
+            ):
+                eris_error: ErisError = error  # type: ignore[assignment]
                 caused_by = last_caused_by = []
-                stack = last_stack = list(error.inspector.lines)
-
-                exc_info: ExcInfo = dict(
-                    exc_type=repr(type(error)),
-                    exc_value=repr(error),
-                    exc_msg=error.args[0],
-                )
-                eris_error_dict: ErisErrorDict = dict(
-                    exc_info=exc_info,
-                    lineno=error.inspector.line_number,
-                    module_name=error.inspector.module_name,
-                    func_name=error.inspector.function_name,
-                    file_name=error.inspector.file_name,
-                    stack=stack,
-                    caused_by=caused_by,
-                )
-                result.append(eris_error_dict)
+                lineno = eris_error._lineno
+                if include_source and isinstance(lineno, int):
+                    line = linecache.getline(eris_error._file_name, lineno)
+                    stack = last_stack = [line] if line else []
+                else:
+                    stack = last_stack = []
+
+                exc_info: ExcInfo = {
+                    "exc_type": repr(error_type),
+                    "exc_value": repr(error),
+                    "exc_msg": error.args[0],
+                }
+                eris_error_dict: ErisErrorDict = {
+                    "exc_info": exc_info,
+                    "lineno": eris_error._lineno,
+                    "module_name": eris_error._module_name,
+                    "func_name": eris_error._func_name,
+                    "file_name": eris_error._file_name,
+                    "stack": stack,
+                    "caused_by": caused_by,
+                }
+                result[result_idx] = eris_error_dict
+                result_idx += 1
             else:
                 assert last_stack is not None, FIRST_EXC_IS_WRONG_TYPE
                 assert last_caused_by is not None, FIRST_EXC_IS_WRONG_TYPE
@@ -139,7 +271,7 @@ class ErisError(Exception):
                 # extend the last Error's 'caused_by' list with this
                 # Exception's info...
                 exc_info_tuple: ExcInfo = {
-                    "exc_type": repr(type(error)),
+                    "exc_type": repr(error_type),
                     "exc_value": repr(error),
                     "exc_msg": str(error.args[0]) if error.args else NULL,
                 }
@@ -147,12 +279,33 @@ class ErisError(Exception):
 
                 # extend the stack by using lines from this Exception's
                 # traceback...
-                if tb := error.__traceback__:
+                tb = error.__traceback__
+                if tb and include_source:
                     last_stack.extend(traceback.extract_tb(tb).format())
+                else:
+                    while tb:
+                        code = tb.tb_frame.f_code
+                        last_stack.append(
+                            f'  File "{code.co_filename}", line'
+                            f" {tb.tb_lineno}, in {code.co_name}\n"
+                        )
+                        tb = tb.tb_next
 
         return result
 
 
+def _rebuild_eris_error(
+    cls: Type[ErisError], args: Tuple[Any, ...]
+) -> ErisError:
+    """Reconstructs an ErisError (e.g. when it is unpickled or copied).
+
+    NOTE: The error's metadata is restored afterwards by __setstate__().
+    """
+    error = cls.__new__(cls, *args)
+    error._repr_cache = None
+    return error
+
+
 def _chain_errors(e1: Exc_T, e2: Optional[Exception]) -> Exc_T:
     """Chain two exceptions together.
 
@@ -165,6 +318,10 @@ def _chain_errors(e1: Exc_T, e2: Optional[Exception]) -> Exc_T:
     Returns:
         ``e1`` after chaining ``e2`` to it.
     """
+    # Chaining None onto the end of the chain is a no-op.
+    if e2 is None:
+        return e1
+
     e: BaseException = e1
     cause = e.__cause__
     while cause:
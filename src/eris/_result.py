@@ -69,24 +69,38 @@ Examples:
             msg = do_stuff().unwrap()  # raises SomeError if an error occurs
             logger.info(msg)
             return 0
+
+    On Python 3.10+, Result objects also support structural pattern matching
+    (the keyword form shown below is the fastest way to match, since it lets
+    Python skip the `__match_args__` lookup):
+
+        def main() -> int:
+            match do_stuff():
+                case Ok(value=msg):
+                    logger.info(msg)
+                    return 0
+                case Err(error=e):
+                    logger.error("An error occurred while doing stuff: %r", e)
+                    return 1
 """
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from dataclasses import InitVar, dataclass, field
+from enum import Enum
 from functools import wraps
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Final,
     Generic,
     NoReturn,
     Optional,
     Tuple,
+    Type,
     TypeVar,
     Union,
-    cast,
 )
 
 from ._errors import ErisError, ErisErrorChain
@@ -96,70 +110,170 @@ T = TypeVar("T")
 E = TypeVar("E", bound=ErisError)
 ErrType = TypeVar("ErrType", bound="Err")
 
+BOOL_NOT_ALLOWED: Final = (
+    "%s object cannot be evaluated as a boolean. This is probably a bug in"
+    " your code. Make sure you are either explicitly checking for Err results"
+    " or using one of the `Result.unwrap*()` methods:  %r"
+)
 
-class AbstractResult(ABC, Generic[T, E]):
-    """This class defines what a Result object looks like."""
 
-    def __bool__(self) -> NoReturn:
-        """Called implicitly on `bool(ok_or_err)`.
+class _Unset(Enum):
+    """The type of the `_UNSET` sentinel.
+
+    We use an Enum (instead of a plain `object()`) so that `_UNSET` is still
+    `_UNSET` after it has been copied or pickled (e.g. along with a LazyResult
+    object).
+    """
+
+    UNSET = 0
+
+
+# Used by LazyResult to mark a result that has not been computed yet.
+_UNSET: Final[object] = _Unset.UNSET
+
+
+class _BoolNotAllowedError(ValueError):
+    """Raised when a Result object is evaluated as a boolean.
+
+    The error message is only built when it is actually needed, since building
+    it requires calling `repr()` on the offending Result object (which might
+    be expensive).
+    """
+
+    def __str__(self) -> str:  # noqa: D105
+        result = self.args[0]
+        return BOOL_NOT_ALLOWED % (result.__class__.__name__, result)
+
+
+def _return_none() -> None:
+    return None
+
+
+class AbstractResult(Generic[T, E]):
+    """This class defines what a Result object looks like.
+
+    NOTE: This class intentionally does NOT use `abc.ABCMeta` as its
+    metaclass, since doing so slows down `isinstance()` checks against Ok and
+    Err objects (which are performed constantly by client code).
+    """
+
+    __slots__ = ()
+
+    # This guard only exists to catch bugs, so it is not defined when Python
+    # is run with optimizations enabled (i.e. `python -O`).
+    if __debug__:
+
+        def __bool__(self) -> NoReturn:
+            """Called implicitly on `bool(ok_or_err)`.
+
+            We raise a ValueError here to prevent Ok/Err objects from being
+            evaluated as bools, which can make it easy to forget to check for
+            errors and make it seem like a predicate (i.e. a function that
+            returns a bool) always returns True.
+            """
+            raise _BoolNotAllowedError(self)
 
-        We raise a ValueError here to prevent Ok/Err objects from being
-        evaluated as bools, which can make it easy to forget to check for
-        errors and make it seem like a predicate (i.e. a function that returns
-        a bool) always returns True.
-        """
-        raise ValueError(
-            f"{self.__class__.__name__} object cannot be evaluated as a"
-            " boolean. This is probably a bug in your code. Make sure you are"
-            " either explicitly checking for Err results or using one of the"
-            f" `Result.unwrap*()` methods:  {self!r}"
-        )
-
-    @abstractmethod
     def err(self) -> Optional[E]:
         """Returns None if successful or an Exception type otherwise."""
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap(self) -> T:
         """Returns real return type or raises an exception if unsuccessful."""
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap_or(self, default: T) -> T:
         """Returns real return type if successful or ``default`` otherwise."""
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap_or_else(self, op: Callable[[E], T]) -> T:
         """Returns real return type if successful or ``op(e)`` otherwise."""
+        raise NotImplementedError
 
 
-@dataclass(frozen=True)
 class Ok(AbstractResult[T, E]):
     """Ok result type.
 
     A value that indicates success and which stores arbitrary data for the
     return value.
+
+    NOTE: Ok objects should be treated as immutable. This allows us to share a
+    single instance between all `Ok(None)` calls (the same goes for
+    `Ok(True)` and `Ok(False)`).
     """
 
+    __slots__ = ("_value",)
+    __match_args__: Final = ("value",)
+
     _value: T
 
-    @staticmethod
-    def err() -> None:  # noqa: D102
-        return None
+    def __new__(cls, value: T) -> Ok[T, E]:  # noqa: D102
+        if cls is Ok and (value is None or value is True or value is False):
+            return _OK_SINGLETONS[value]
+        # NOTE: We set _value here instead of defining __init__(), since
+        # Python would otherwise call __init__() on the shared objects above.
+        ok: Ok[T, E] = object.__new__(cls)
+        ok._value = value
+        return ok
+
+    def __getnewargs__(self) -> Tuple[T]:  # noqa: D105
+        # Needed by copy / pickle, since __new__() requires an argument.
+        return (self._value,)
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{self.__class__.__name__}(_value={self._value!r})"
+
+    def __eq__(self, other: object) -> bool:  # noqa: D105
+        if other.__class__ is self.__class__:
+            # Compare 1-tuples (like a dataclass would) so that identical
+            # values are always equal (e.g. float("nan")).
+            other_value = other._value  # type: ignore[attr-defined]
+            return (self._value,) == (other_value,)
+        return NotImplemented
+
+    def __hash__(self) -> int:  # noqa: D105
+        return hash((self._value,))
+
+    # Every Ok object shares the same module-level err() function, which
+    # allows for cheap `result.err is _return_none` checks.
+    if TYPE_CHECKING:
+
+        @staticmethod
+        def err() -> None:  # noqa: D102
+            ...
+
+    else:
+        err = staticmethod(_return_none)
+
+    @property
+    def value(self) -> T:
+        """The value wrapped by this Ok object."""
+        return self._value
 
     def ok(self) -> T:  # noqa: D102
         return self._value
 
-    def unwrap(self) -> T:  # noqa: D102
-        return self.ok()
+    # On an Ok object, unwrap() is just another name for ok().
+    unwrap = ok
 
     def unwrap_or(self, default: T) -> T:  # noqa: D102
-        return self.ok()
+        return self._value
 
     def unwrap_or_else(self, op: Callable[[E], T]) -> T:  # noqa: D102
-        return self.ok()
+        return self._value
+
+
+def _new_ok_singleton(value: Optional[bool]) -> Ok[Any, Any]:
+    ok: Ok[Any, Any] = object.__new__(Ok)
+    ok._value = value
+    return ok
+
+
+# Maps a value to the one-and-only `Ok(value)` object (see `Ok.__new__()`).
+_OK_SINGLETONS: Final[Dict[Optional[bool], Ok[Any, Any]]] = {
+    value: _new_ok_singleton(value) for value in (None, True, False)
+}
 
 
-@dataclass
 class Err(AbstractResult[T, E]):
     """Err result type.
 
@@ -167,13 +281,14 @@ class Err(AbstractResult[T, E]):
     error.
     """
 
+    __slots__ = ("_error",)
+    __match_args__: Final = ("error",)
+
     # `error_spec` is used to construct `_error` and is then thrown away
     #
     # WARNING: If `error_spec` is a string, then the type variable `E` _must_
     # be `ErisError`!
-    error_spec: InitVar[Union[str, E]]
-    _error: E = field(init=False)
-
+    #
     # `up` is used to control what set of metadata we see when inspecting an
     # ErisError. Useful when writing functions that are meant to wrap the Err
     # type.
@@ -182,44 +297,96 @@ class Err(AbstractResult[T, E]):
     # this argument is passed to ErisError to construct it. This argument has
     # no effect otherwise (since assertions are probably a bad idea inside of
     # error-handling logic).
-    up: InitVar[int] = 0
+    def __init__(self, error_spec: Union[str, E], up: int = 0) -> None:
+        self._error: E
+        # We check for an exact type match here (instead of using isinstance)
+        # since it is faster and `error_spec` should never be a str subclass.
+        if type(error_spec) is str:  # pylint: disable=unidiomatic-typecheck
+            self._error = ErisError(  # type: ignore[assignment]
+                error_spec, up=up + 1
+            )
+        else:
+            self._error = error_spec  # type: ignore[assignment]
 
-    def __post_init__(self, error_spec: Union[str, E], up: int) -> None:
-        """Special `dataclasses.dataclass` method.
+    @classmethod
+    def from_error(cls: Type[ErrType], error: E) -> ErrType:
+        """Constructs an Err object from an existing error.
 
-        We perform the following tasks at post-init time:
-            * Set the `_error` attribute.
+        This is equivalent to (but slightly faster than) `Err(error)`.
         """
-        if isinstance(error_spec, str):
-            self._error = cast(E, ErisError(error_spec, up=up + 2))
-        else:
-            self._error = error_spec
+        err = cls.__new__(cls)
+        err._error = error
+        return err
+
+    @classmethod
+    def from_str(cls: Type[ErrType], emsg: str, up: int = 0) -> ErrType:
+        """Constructs an Err object from an error message.
+
+        This is equivalent to (but slightly faster than) `Err(emsg, up=up)`.
+        """
+        err = cls.__new__(cls)
+        err._error = ErisError(emsg, up=up + 1)
+        return err
+
+    @classmethod
+    def from_literal(cls: Type[ErrType], emsg: str) -> ErrType:
+        """Constructs an Err object WITHOUT inspecting the stack.
+
+        This is faster than `Err(emsg)`, but the resulting ErisError will have
+        "null" metadata (e.g. its line number will be "null"). Use this in hot
+        code paths where the location of an error is not needed.
+        """
+        err = cls.__new__(cls)
+        err._error = ErisError(emsg, up=None)
+        return err
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{self.__class__.__name__}(_error={self._error!r})"
+
+    def __eq__(self, other: object) -> bool:  # noqa: D105
+        if other.__class__ is self.__class__:
+            # Compare 1-tuples (like a dataclass would) so that identical
+            # values are always equal (e.g. float("nan")).
+            other_error = other._error  # type: ignore[attr-defined]
+            return (self._error,) == (other_error,)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def error(self) -> E:
+        """The error wrapped by this Err object."""
+        return self._error
 
     def err(self) -> E:  # noqa: D102
         return self._error
 
     def unwrap(self) -> NoReturn:  # noqa: D102
-        raise self.err()
+        raise self._error
 
     def unwrap_or(self, default: T) -> T:  # noqa: D102
         return default
 
     def unwrap_or_else(self, op: Callable[[E], T]) -> T:  # noqa: D102
-        return op(self.err())
+        return op(self._error)
 
     def chain(self: ErrType, exc_or_err: Union[Exception, Err]) -> ErrType:
         """Wraps another Exception object with this Exception object."""
-        if isinstance(exc_or_err, Exception):
+        # An exact Err match only costs a pointer comparison, so we check for
+        # that before falling back to isinstance().
+        if exc_or_err.__class__ is Err:
+            other_exception = exc_or_err._error  # type: ignore[union-attr]
+        elif isinstance(exc_or_err, Exception):
             other_exception = exc_or_err
         else:
             other_exception = exc_or_err.err()
 
-        self.err().chain(other_exception)
+        self._error.chain(other_exception)
         return self
 
-    def to_json(self) -> ErisErrorChain:
+    def to_json(self, include_source: bool = True) -> ErisErrorChain:
         """A thin wrapper around ErisError.to_json()."""
-        return self.err().to_json()
+        return self._error.to_json(include_source=include_source)
 
 
 # The 'Result' return type is used to implement an error-handling model heavily
@@ -244,9 +411,11 @@ def return_lazy_result(
     side-effects), since it makes it harder to ignore potential errors.
     """
 
+    from_prebound = LazyResult._from_prebound
+
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> LazyResult[T, E]:
-        return LazyResult(func, *args, **kwargs)
+        return from_prebound(func, args, kwargs)
 
     return wrapper
 
@@ -254,6 +423,8 @@ def return_lazy_result(
 class LazyResult(AbstractResult[T, E]):
     """See `help(return_lazy_result)`."""
 
+    __slots__ = ("_func", "_args", "_kwargs", "_result")
+
     def __init__(
         self, func: Callable[..., Result[T, E]], *args: Any, **kwargs: Any
     ) -> None:
@@ -261,7 +432,28 @@ class LazyResult(AbstractResult[T, E]):
         self._args: Tuple[Any, ...] = args
         self._kwargs: Dict[str, Any] = kwargs
 
-        self._result: Optional[Result[T, E]] = None
+        # NOTE: This attribute is set to _UNSET until self.result() is called.
+        self._result: Result[T, E] = _UNSET  # type: ignore[assignment]
+
+    @classmethod
+    def _from_prebound(
+        cls,
+        func: Callable[..., Result[T, E]],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> LazyResult[T, E]:
+        """Alternate constructor used by `return_lazy_result()`.
+
+        Unlike `__init__()`, this method accepts the tuple / dict that hold
+        func's arguments directly, which saves us from having to unpack and
+        then re-pack them on every call to a decorated function.
+        """
+        self: LazyResult[T, E] = object.__new__(cls)
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._result = _UNSET  # type: ignore[assignment]
+        return self
 
     def result(self) -> Result[T, E]:
         """Retrieve the Result object corresponding with this LazyResult.
@@ -270,18 +462,65 @@ class LazyResult(AbstractResult[T, E]):
         will only be called once, even if this method is called multiple times)
         and returns the same Result returned by that function.
         """
-        if self._result is None:
+        if self._result is _UNSET:
             self._result = self._func(*self._args, **self._kwargs)
+            # From now on, this object's methods can use the cached result
+            # directly (i.e. without checking for it first). We leave
+            # subclasses alone, since switching their class would discard
+            # any methods they override.
+            if self.__class__ is LazyResult:
+                self.__class__ = _ResolvedLazyResult
+        return self._result
+
+    # NOTE: The following methods check for a cached result themselves (for
+    # the sake of LazyResult subclasses), so that only the first call has to
+    # pay for calling self.result().
+    def err(self) -> Optional[E]:  # noqa: D102
+        result = self._result
+        if result is _UNSET:
+            result = self.result()
+        return result.err()
+
+    def unwrap(self) -> T:  # noqa: D102
+        result = self._result
+        if result is _UNSET:
+            result = self.result()
+        return result.unwrap()
+
+    def unwrap_or(self, default: T) -> T:  # noqa: D102
+        result = self._result
+        if result is _UNSET:
+            result = self.result()
+        return result.unwrap_or(default)
+
+    def unwrap_or_else(self, op: Callable[[E], T]) -> T:  # noqa: D102
+        result = self._result
+        if result is _UNSET:
+            result = self.result()
+        return result.unwrap_or_else(op)
+
+
+class _ResolvedLazyResult(LazyResult[T, E]):
+    """The class of any LazyResult object whose result has been computed.
+
+    LazyResult.result() switches an object's class to this one once it has
+    called that object's function (unless the object's class is a subclass of
+    LazyResult).
+    """
+
+    __slots__ = ()
+
+    def result(self) -> Result[T, E]:  # noqa: D102
         return self._result
 
     def err(self) -> Optional[E]:  # noqa: D102
-        return self.result().err()
+        return self._result.err()
 
     def unwrap(self) -> T:  # noqa: D102
-        return self.result().unwrap()
+        return self._result.unwrap()
 
     def unwrap_or(self, default: T) -> T:  # noqa: D102
-        return self.result().unwrap_or(default)
+        return self._result.unwrap_or(default)
 
     def unwrap_or_else(self, op: Callable[[E], T]) -> T:  # noqa: D102
-        return self.result().unwrap_or_else(op)
+        return self._result.unwrap_or_else(op)
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Any, Final, Optional
+import copy
+import pickle
+from typing import Any, Final, Optional, get_type_hints
 
-from pytest import mark
+from pytest import mark, raises
 from syrupy.assertion import SnapshotAssertion as Snapshot
 
-from eris import ErisError, Err, Ok, Result
+from eris import ErisError, Err, LazyResult, Ok, Result, return_lazy_result
 
 
 params = mark.parametrize
 
 DEFAULT_FOOBAR: Final = "FOOBAR"
 ERROR_MSG: Final = "Something went wrong..."
+TEST_ERROR: Final = ErisError("test error")
 
 
 class CustomErisError(ErisError):
@@ -45,8 +48,7 @@ def fail_with_custom_error(foobar: str = None) -> Result[int, CustomErisError]:
 
 def test_init_err_with_error() -> None:
     """Test the Err.err() method."""
-    error = ErisError("test error")
-    assert Err(error).err() == error
+    assert Err(TEST_ERROR).err() == TEST_ERROR
 
 
 def test_init_err_with_string() -> None:
@@ -139,3 +141,311 @@ def test_custom_error(foobar: Optional[str], expected: str) -> None:
     assert isinstance(my_result, Err)
     err = my_result.err()
     assert err.foobar == expected
+    assert repr(err).startswith("CustomErisError::")
+
+
+def test_chain_order() -> None:
+    """Tests that chained exceptions are iterated over in the right order."""
+    error = ErisError(ERROR_MSG)
+    other_error = ErisError(ERROR_MSG).chain(KeyError("foo"))
+    error.chain(ValueError("bar")).chain(other_error).chain(IndexError("baz"))
+    assert [type(e) for e in error] == [
+        ErisError,
+        ValueError,
+        ErisError,
+        KeyError,
+        IndexError,
+    ]
+
+    try:
+        raise error from RuntimeError("buz")
+    except ErisError:
+        pass
+
+    error.chain(TypeError("qux"))
+    assert [type(e) for e in error] == [ErisError, RuntimeError, TypeError]
+
+    error = ErisError(ERROR_MSG)
+    other_error = ErisError(ERROR_MSG)
+    error.chain(other_error)
+    try:
+        raise other_error from RuntimeError("buz")
+    except ErisError:
+        pass
+
+    error.chain(TypeError("qux"))
+    assert [type(e) for e in error] == [
+        ErisError,
+        ErisError,
+        RuntimeError,
+        TypeError,
+    ]
+
+    error = ErisError(ERROR_MSG)
+    other_error = ErisError(ERROR_MSG).chain(KeyError("foo"))
+    error.chain(ValueError("bar")).chain(other_error).chain(IndexError("baz"))
+    try:
+        raise other_error from RuntimeError("buz")
+    except ErisError:
+        pass
+
+    error.chain(TypeError("qux"))
+    assert [type(e) for e in error] == [
+        ErisError,
+        ValueError,
+        ErisError,
+        RuntimeError,
+        TypeError,
+    ]
+
+    error = ErisError(ERROR_MSG)
+    value_error = ValueError("bar")
+    error.chain(value_error).chain(KeyError("foo")).chain(IndexError("baz"))
+    try:
+        raise value_error from RuntimeError("buz")
+    except ValueError:
+        pass
+
+    error.chain(TypeError("qux"))
+    assert [type(e) for e in error] == [
+        ErisError,
+        ValueError,
+        RuntimeError,
+        TypeError,
+    ]
+
+
+def test_lazy_result() -> None:
+    """Tests that a LazyResult only calls its function once."""
+    calls = []
+
+    @return_lazy_result
+    def do_stuff(x: int, *, y: int = 0) -> Result[int, ErisError]:
+        calls.append((x, y))
+        return Ok(x + y)
+
+    assert do_stuff.__name__ == "do_stuff"
+    assert do_stuff.__wrapped__.__name__ == "do_stuff"  # type: ignore
+
+    lazy_result = do_stuff(1, y=2)
+    assert not calls
+    assert lazy_result.unwrap() == 3
+    assert lazy_result.err() is None
+    assert lazy_result.unwrap_or(0) == 3
+    assert lazy_result.unwrap_or_else(lambda e: 0) == 3
+    assert lazy_result.result() == Ok(3)
+    assert isinstance(lazy_result, LazyResult)
+    assert calls == [(1, 2)]
+
+
+def test_is_json__NO_SOURCE() -> None:
+    """Test the Err/Error.to_json() methods with include_source=False."""
+    try:
+        x = 1 / 0
+        print(x)
+    except ZeroDivisionError as zero_div_error:
+        err: Err = Err(ERROR_MSG).chain(zero_div_error)
+        error_dict = err.to_json(include_source=False)[0]
+
+    lineno = error_dict["lineno"]
+    assert isinstance(lineno, int)
+    assert error_dict["stack"] == [
+        f'  File "{__file__}", line {lineno - 3}, in test_is_json__NO_SOURCE\n'
+    ]
+
+
+@params("value", [None, True, False])
+def test_ok_singletons(value: Optional[bool]) -> None:
+    """Tests that common Ok values share a single object."""
+    ok: Ok[Optional[bool], ErisError] = Ok(value)
+    assert ok is Ok(value)
+    assert ok.unwrap() is value
+    assert ok == Ok(value)
+    assert Ok(1) is not Ok(1)
+
+    class CustomOk(Ok[Optional[bool], ErisError]):
+        """Custom Ok type."""
+
+    custom_ok = CustomOk(value)
+    assert custom_ok is not ok
+    assert custom_ok.unwrap() is value
+
+
+@mark.skipif(not __debug__, reason="__bool__() is not defined under -O")
+@params("result", [Ok(1), Err(ERROR_MSG)])
+def test_bool_not_allowed(result: Result[int, ErisError]) -> None:
+    """Tests that Result objects cannot be evaluated as booleans."""
+    with raises(ValueError, match="cannot be evaluated as a boolean"):
+        bool(result)
+
+
+def test_match_args() -> None:
+    """Tests the attributes used when pattern matching on Result objects."""
+    ok: Ok[int, ErisError] = Ok(1)
+    assert Ok.__match_args__ == ("value",)
+    assert ok.value == 1
+
+    err: Err[int, ErisError] = Err(ERROR_MSG)
+    assert Err.__match_args__ == ("error",)
+    assert err.error is err.err()
+
+
+def test_err_from_literal() -> None:
+    """Tests the Err.from_literal() constructor."""
+    err: Err[int, ErisError] = Err.from_literal(ERROR_MSG)
+    error = err.err()
+    assert error.args[0] == ERROR_MSG
+    assert error.lineno == "null"
+
+    error_dict = error.to_json()[0]
+    assert error_dict["module_name"] == "null"
+    assert error_dict["stack"] == []
+
+
+def test_err_from_error_and_str() -> None:
+    """Tests the Err.from_error() and Err.from_str() constructors."""
+    assert Err.from_error(TEST_ERROR) == Err(TEST_ERROR)
+
+    err: Err[int, ErisError] = Err.from_str(ERROR_MSG)
+    error = err.err()
+    assert error.args[0] == ERROR_MSG
+    assert error.func_name == "test_err_from_error_and_str"
+
+
+@params(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda x: pickle.loads(pickle.dumps(x))],
+)
+def test_error_clone(clone: Any) -> None:
+    """Tests that copied / unpickled errors keep their metadata."""
+    error = CustomErisError(ERROR_MSG, foobar="baz", up=1)
+    new_error = clone(error)
+
+    assert new_error.__class__ is CustomErisError
+    assert new_error.args == error.args
+    assert new_error.foobar == "baz"
+    assert new_error.module_name == error.module_name
+    assert new_error.func_name == "test_error_clone"
+    assert new_error.lineno == error.lineno
+    assert new_error.file_name == error.file_name
+    assert repr(new_error) == repr(error)
+    assert list(new_error.chain(TEST_ERROR)) == [new_error, TEST_ERROR]
+
+
+def test_eq_identity() -> None:
+    """Tests that Ok objects wrapping the same value are always equal."""
+    nan = float("nan")
+    assert Ok(nan) == Ok(nan)
+    assert Ok(nan) != Ok(float("nan"))
+
+
+def test_str_uses_repr_override() -> None:
+    """Tests that str() respects a subclass's __repr__() override."""
+
+    class ReprErisError(ErisError):
+        def __repr__(self) -> str:
+            return "ReprErisError"
+
+    assert str(ReprErisError(ERROR_MSG)) == "ReprErisError"
+
+
+@params(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda x: pickle.loads(pickle.dumps(x))],
+)
+@params("value", [None, True, False, 1, "foo"])
+def test_ok_clone(clone: Any, value: Any) -> None:
+    """Tests that Ok objects can be copied and pickled."""
+    ok: Ok[Any, ErisError] = Ok(value)
+    new_ok = clone(ok)
+    assert new_ok == ok
+    assert new_ok.unwrap() == value
+    if value is None or isinstance(value, bool):
+        assert new_ok is ok
+
+
+def test_err_chain_result() -> None:
+    """Tests that Err.chain() accepts any Result-like object."""
+    err: Err[int, ErisError] = Err(ERROR_MSG)
+    other_err: Err[int, ErisError] = Err(ERROR_MSG)
+    lazy_result: LazyResult[int, ErisError] = LazyResult(lambda: other_err)
+    err.chain(lazy_result)  # type: ignore[arg-type]
+    assert list(err.err()) == [err.err(), other_err.err()]
+
+    err.chain(Ok(1))  # type: ignore[arg-type]
+    assert list(err.err()) == [err.err(), other_err.err()]
+
+
+@return_lazy_result
+def lazy_one() -> Result[int, ErisError]:
+    """Helper function used to test the return_lazy_result decorator."""
+    return Ok(1)
+
+
+def test_return_lazy_result_wraps() -> None:
+    """Tests that return_lazy_result preserves the function's metadata."""
+    assert lazy_one.__name__ == "lazy_one"
+    assert lazy_one.__module__ == __name__
+    assert get_type_hints(lazy_one) == get_type_hints(
+        lazy_one.__wrapped__  # type: ignore[attr-defined]
+    )
+    assert "return" in get_type_hints(lazy_one)
+    assert pickle.loads(pickle.dumps(lazy_one)) is lazy_one
+    assert lazy_one().unwrap() == 1
+
+
+def test_err_constructors_subclass() -> None:
+    """Tests that the Err.from_*() constructors respect subclasses."""
+
+    class CustomErr(Err[int, ErisError]):
+        """Custom Err type."""
+
+    assert CustomErr.from_error(TEST_ERROR).__class__ is CustomErr
+    assert CustomErr.from_literal(ERROR_MSG).__class__ is CustomErr
+
+    err: CustomErr = CustomErr.from_str(ERROR_MSG)
+    assert err.__class__ is CustomErr
+    assert err.err().func_name == "test_err_constructors_subclass"
+
+
+def test_lazy_result_subclass() -> None:
+    """Tests that resolving a LazyResult subclass keeps its type."""
+    calls = []
+
+    class CustomLazyResult(LazyResult[int, ErisError]):
+        """Custom LazyResult type."""
+
+        def unwrap(self) -> int:
+            return super().unwrap() + 1
+
+    def func() -> Result[int, ErisError]:
+        calls.append(1)
+        return Ok(1)
+
+    lazy_result = CustomLazyResult(func)
+    assert lazy_result.unwrap() == 2
+    assert lazy_result.unwrap() == 2
+    assert lazy_result.__class__ is CustomLazyResult
+    assert lazy_result.err() is None
+    assert calls == [1]
+
+
+def return_one() -> Result[int, ErisError]:
+    """Helper function used to test copying / pickling LazyResult objects."""
+    return Ok(1)
+
+
+@params(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda x: pickle.loads(pickle.dumps(x))],
+)
+@params("resolved", [False, True])
+def test_lazy_result_clone(clone: Any, resolved: bool) -> None:
+    """Tests that LazyResult objects can be copied and pickled."""
+    lazy_result: LazyResult[int, ErisError] = LazyResult(return_one)
+    if resolved:
+        lazy_result.result()
+
+    new_lazy_result = clone(lazy_result)
+    assert new_lazy_result.unwrap() == 1
+    assert new_lazy_result.result() == Ok(1)